@@ -1,5 +1,8 @@
+# ruff: noqa: TC004
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 __docformat__ = "restructuredtext"
 
 # Let users know if they're missing any of our hard dependencies
@@ -23,8 +26,13 @@ try:
     from pandas.compat import (
         is_numpy_dev as _is_numpy_dev,  # pyright: ignore[reportUnusedImport] # noqa: F401
     )
-except ImportError as _err:  # pragma: no cover
+
+    # C extensions
+    from pandas import _libs  # pyright: ignore[reportUnusedImport] # noqa: F401
+except ModuleNotFoundError as _err:  # pragma: no cover
     _module = _err.name
+    if not (_module or "").startswith("pandas._libs"):
+        raise
     raise ImportError(
         f"C extension: {_module} not built. If you want to import "
         "pandas from the source directory, you may need to run "
@@ -113,64 +121,126 @@ from pandas.core.dtypes.dtypes import SparseDtype
 from pandas.tseries.api import infer_freq
 from pandas.tseries import offsets
 
-from pandas.core.computation.api import eval
-
-from pandas.core.reshape.api import (
-    concat,
-    lreshape,
-    melt,
-    wide_to_long,
-    merge,
-    merge_asof,
-    merge_ordered,
-    crosstab,
-    pivot,
-    pivot_table,
-    get_dummies,
-    from_dummies,
-    cut,
-    qcut,
-)
+from pandas import _lazy, arrays, errors, io, plotting, tseries
 
-from pandas import api, arrays, errors, io, plotting, tseries
-from pandas import testing
-from pandas.util._print_versions import show_versions
-
-from pandas.io.api import (
+# Names that are only imported on first attribute access (PEP 562), keyed by
+# the module that defines them. An entry whose module is ``pandas.<name>``
+# resolves to that subpackage itself.
+_lazy_imports: dict[str, str] = {
+    "api": "pandas.api",
+    "eval": "pandas.core.computation.api",
+    "json_normalize": "pandas.io.json._normalize",
+    "show_versions": "pandas.util._print_versions",
+    "test": "pandas.util._tester",
+    "testing": "pandas.testing",
+    # reshape
+    "concat": "pandas.core.reshape.concat",
+    "lreshape": "pandas.core.reshape.melt",
+    "melt": "pandas.core.reshape.melt",
+    "wide_to_long": "pandas.core.reshape.melt",
+    "merge": "pandas.core.reshape.merge",
+    "merge_asof": "pandas.core.reshape.merge",
+    "merge_ordered": "pandas.core.reshape.merge",
+    "crosstab": "pandas.core.reshape.pivot",
+    "pivot": "pandas.core.reshape.pivot",
+    "pivot_table": "pandas.core.reshape.pivot",
+    "get_dummies": "pandas.core.reshape.encoding",
+    "from_dummies": "pandas.core.reshape.encoding",
+    "cut": "pandas.core.reshape.tile",
+    "qcut": "pandas.core.reshape.tile",
+    # io: each reader/writer only loads its own backend module
     # excel
-    ExcelFile,
-    ExcelWriter,
-    read_excel,
+    "ExcelFile": "pandas.io.excel",
+    "ExcelWriter": "pandas.io.excel",
+    "read_excel": "pandas.io.excel",
     # parsers
-    read_csv,
-    read_fwf,
-    read_table,
+    "read_csv": "pandas.io.parsers",
+    "read_fwf": "pandas.io.parsers",
+    "read_table": "pandas.io.parsers",
     # pickle
-    read_pickle,
-    to_pickle,
+    "read_pickle": "pandas.io.pickle",
+    "to_pickle": "pandas.io.pickle",
     # pytables
-    HDFStore,
-    read_hdf,
+    "HDFStore": "pandas.io.pytables",
+    "read_hdf": "pandas.io.pytables",
     # sql
-    read_sql,
-    read_sql_query,
-    read_sql_table,
+    "read_sql": "pandas.io.sql",
+    "read_sql_query": "pandas.io.sql",
+    "read_sql_table": "pandas.io.sql",
     # misc
-    read_clipboard,
-    read_parquet,
-    read_orc,
-    read_feather,
-    read_html,
-    read_xml,
-    read_json,
-    read_stata,
-    read_sas,
-    read_spss,
-)
+    "read_clipboard": "pandas.io.clipboards",
+    "read_parquet": "pandas.io.parquet",
+    "read_orc": "pandas.io.orc",
+    "read_feather": "pandas.io.feather_format",
+    "read_html": "pandas.io.html",
+    "read_xml": "pandas.io.xml",
+    "read_json": "pandas.io.json",
+    "read_stata": "pandas.io.stata",
+    "read_sas": "pandas.io.sas",
+    "read_spss": "pandas.io.spss",
+}
+
+if TYPE_CHECKING:
+    # the lazy names above, spelled out so type checkers can resolve them
+    from pandas.core.computation.api import eval
+
+    from pandas.core.reshape.api import (
+        concat,
+        lreshape,
+        melt,
+        wide_to_long,
+        merge,
+        merge_asof,
+        merge_ordered,
+        crosstab,
+        pivot,
+        pivot_table,
+        get_dummies,
+        from_dummies,
+        cut,
+        qcut,
+    )
+
+    from pandas import api, testing
+    from pandas.util._print_versions import show_versions
+
+    from pandas.io.api import (
+        # excel
+        ExcelFile,
+        ExcelWriter,
+        read_excel,
+        # parsers
+        read_csv,
+        read_fwf,
+        read_table,
+        # pickle
+        read_pickle,
+        to_pickle,
+        # pytables
+        HDFStore,
+        read_hdf,
+        # sql
+        read_sql,
+        read_sql_query,
+        read_sql_table,
+        # misc
+        read_clipboard,
+        read_parquet,
+        read_orc,
+        read_feather,
+        read_html,
+        read_xml,
+        read_json,
+        read_stata,
+        read_sas,
+        read_spss,
+    )
+
+    from pandas.io.json._normalize import json_normalize
 
-from pandas.io.json._normalize import json_normalize
+    from pandas.util._tester import test
 
-from pandas.util._tester import test
+_lazy.install(_lazy_imports, globals())
 
 # use the closest tagged version if possible
 _built_with_meson = False
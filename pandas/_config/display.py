@@ -37,9 +37,9 @@ def detect_console_encoding() -> str:
             #  (on some systems, see stdlib locale docs)
             pass
 
-    # when all else fails. this will usually be "ascii"
-    if not encoding or "ascii" in encoding.lower():
-        encoding = sys.getdefaultencoding()
+        # when all else fails. this will usually be "ascii"
+        if not encoding or "ascii" in encoding.lower():
+            encoding = sys.getdefaultencoding()
 
     # GH#3360, save the reported defencoding at import time
     # MPL backends may change it. Make available for debugging.
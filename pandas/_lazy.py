@@ -0,0 +1,50 @@
+"""
+Deferred attribute imports for pandas namespaces (PEP 562).
+
+Packages declare the names they want to expose without importing them and
+call :func:`install` with that table. The defining module is only imported
+the first time the attribute is accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+
+def install(table: dict[str, str], namespace: dict[str, Any]) -> None:
+    """
+    Install a module-level ``__getattr__`` and ``__dir__`` into ``namespace``.
+
+    Parameters
+    ----------
+    table : dict[str, str]
+        Maps each attribute name to the module that defines it. An entry
+        whose module is ``<package>.<name>`` resolves to that submodule.
+    namespace : dict[str, Any]
+        The ``globals()`` of the package exposing the names.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = table[name]
+        except KeyError:
+            raise AttributeError(
+                f"module '{package}' has no attribute '{name}'"
+            ) from None
+
+        module = importlib.import_module(module_name)
+        if module_name == f"{package}.{name}":
+            value = module
+        else:
+            value = getattr(module, name)
+        # cache on the module so later lookups bypass __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(table))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
@@ -149,6 +149,9 @@ class Interval(IntervalMixin, Generic[_OrderableT]):
 def intervals_to_interval_bounds(
     intervals: np.ndarray, validate_closed: bool = ...
 ) -> tuple[np.ndarray, np.ndarray, IntervalClosedType]: ...
+def validate_interval_bounds(
+    left: np.ndarray, right: np.ndarray, datetimelike: bool = ...
+) -> int: ...
 
 class IntervalTree(IntervalMixin):
     def __init__(
@@ -674,4 +674,65 @@ def intervals_to_interval_bounds(ndarray intervals, bint validate_closed=True):
     return left, right, closed
 
 
+cdef int64_t NPY_NAT = util.get_nat()
+
+ctypedef fused interval_bound_t:
+    float64_t
+    int64_t
+    uint64_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def validate_interval_bounds(
+    const interval_bound_t[:] left,
+    const interval_bound_t[:] right,
+    bint datetimelike=False,
+):
+    """
+    Check the endpoints of an IntervalArray in a single pass.
+
+    Parameters
+    ----------
+    left, right : ndarray
+        Endpoints of equal length. datetime64/timedelta64 endpoints are
+        passed as their int64 view.
+    datetimelike : bool, default False
+        Whether NaT marks missing values in int64 endpoints.
+
+    Returns
+    -------
+    int
+        0 if valid, 1 if left and right are missing in different locations,
+        2 if a left endpoint is greater than its right endpoint.
+    """
+    cdef:
+        Py_ssize_t i, n = len(left)
+        bint left_na, right_na
+        interval_bound_t lval, rval
+        int result = 0
+
+    with nogil:
+        for i in range(n):
+            lval = left[i]
+            rval = right[i]
+            if interval_bound_t is float64_t:
+                left_na = lval != lval
+                right_na = rval != rval
+            elif interval_bound_t is int64_t:
+                left_na = datetimelike and lval == NPY_NAT
+                right_na = datetimelike and rval == NPY_NAT
+            else:
+                left_na = right_na = False
+
+            if left_na != right_na:
+                # takes precedence over misordered endpoints
+                result = 1
+                break
+            if not left_na and lval > rval:
+                result = 2
+
+    return result
+
+
 include "intervaltree.pxi"
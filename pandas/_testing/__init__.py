@@ -370,7 +370,10 @@ def convert_rows_list_to_csv_str(rows_list: list[str]) -> str:
         Expected output of to_csv() in current OS.
     """
     sep = os.linesep
-    return sep.join(rows_list) + sep
+    if not rows_list:
+        return sep
+    # the trailing empty row adds the final separator in the same join
+    return sep.join([*rows_list, ""])
 
 
 def external_error_raised(expected_exception: type[Exception]) -> ContextManager:
@@ -8,7 +8,6 @@ from typing import (
     TYPE_CHECKING,
     Any,
 )
-import uuid
 import zipfile
 
 from pandas.compat._optional import import_optional_dependency
@@ -53,7 +52,8 @@ def round_trip_pickle(
     """
     _path = path
     if _path is None:
-        _path = f"__{uuid.uuid4()}__.pickle"
+        # ensure_clean already makes the file name unique
+        _path = "__round_trip__.pickle"
     with ensure_clean(_path) as temp_path:
         pd.to_pickle(obj, temp_path)
         return pd.read_pickle(temp_path)
@@ -96,8 +96,8 @@ def write_to_compressed(compression, path, data, dest: str = "test") -> None:
         The compression type to use.
     path : str
         The file path to write the data.
-    data : str
-        The data to write.
+    data : bytes
+        The data to write. It is handed to the compressor in a single call.
     dest : str, default "test"
         The destination file (for ZIP only)
 
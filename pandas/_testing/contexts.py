@@ -84,6 +84,10 @@ def set_timezone(tz: str) -> Generator[None]:
                 time.tzset()
 
     orig_tz = os.environ.get("TZ")
+    if orig_tz == tz:
+        # already in effect, e.g. nested use; skip the tzset round-trips
+        yield
+        return
     setTZ(tz)
     try:
         yield
@@ -119,8 +123,7 @@ def ensure_clean(filename=None) -> Generator[Any]:
     try:
         yield handle_or_str
     finally:
-        if path.is_file():
-            path.unlink()
+        path.unlink(missing_ok=True)
 
 
 @contextmanager
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import abc
-from collections import defaultdict
+from collections import (
+    Counter,
+    defaultdict,
+)
 from collections.abc import Callable
 import functools
 from functools import partial
@@ -1687,8 +1690,8 @@ def is_multi_agg_with_relabel(**kwargs) -> bool:
     >>> is_multi_agg_with_relabel()
     False
     """
-    return all(isinstance(v, tuple) and len(v) == 2 for v in kwargs.values()) and (
-        len(kwargs) > 0
+    return len(kwargs) > 0 and all(
+        isinstance(v, tuple) and len(v) == 2 for v in kwargs.values()
     )
 
 
@@ -1728,24 +1731,28 @@ def normalize_keyword_aggregation(
     # process normally, then fixup the names.
     # TODO: aggspec type: typing.Dict[str, List[AggScalar]]
     aggspec = defaultdict(list)
+    aggspec_names = defaultdict(list)
     order = []
     columns = tuple(kwargs.keys())
 
     for column, aggfunc in kwargs.values():
+        name = com.get_callable_name(aggfunc) or aggfunc
         aggspec[column].append(aggfunc)
-        order.append((column, com.get_callable_name(aggfunc) or aggfunc))
-
-    # uniquify aggfunc name if duplicated in order list
-    uniquified_order = _make_unique_kwarg_list(order)
+        aggspec_names[column].append(name)
+        order.append((column, name))
 
     # GH 25719, due to aggspec will change the order of assigned columns in aggregation
     # uniquified_aggspec will store uniquified order list and will compare it with order
     # based on index
     aggspec_order = [
-        (column, com.get_callable_name(aggfunc) or aggfunc)
-        for column, aggfuncs in aggspec.items()
-        for aggfunc in aggfuncs
+        (column, name) for column, names in aggspec_names.items() for name in names
     ]
+    if aggspec_order == order:
+        # kwargs already grouped by column, nothing to reorder
+        return aggspec, columns, np.arange(len(order), dtype=np.intp)
+
+    # uniquify aggfunc name if duplicated in order list
+    uniquified_order = _make_unique_kwarg_list(order)
     uniquified_aggspec = _make_unique_kwarg_list(aggspec_order)
 
     # get the new index of columns by comparison
@@ -1765,10 +1772,16 @@ def _make_unique_kwarg_list(
     >>> _make_unique_kwarg_list(kwarg_list)
     [('a', '<lambda>_0'), ('a', '<lambda>_1'), ('b', '<lambda>')]
     """
-    return [
-        (pair[0], f"{pair[1]}_{seq[:i].count(pair)}") if seq.count(pair) > 1 else pair
-        for i, pair in enumerate(seq)
-    ]
+    totals = Counter(seq)
+    seen: defaultdict[tuple[Any, Any], int] = defaultdict(int)
+    result = []
+    for pair in seq:
+        if totals[pair] > 1:
+            result.append((pair[0], f"{pair[1]}_{seen[pair]}"))
+            seen[pair] += 1
+        else:
+            result.append(pair)
+    return result
 
 
 def relabel_result(
@@ -1808,8 +1821,10 @@ def relabel_result(
     """
     from pandas.core.indexes.base import Index
 
+    # stable argsort of the positions, same as sorting (column, position) pairs
+    labels = list(columns)
     reordered_indexes = [
-        pair[0] for pair in sorted(zip(columns, order), key=lambda t: t[1])
+        labels[i] for i in np.argsort(np.asarray(order), kind="stable").tolist()
     ]
     reordered_result_in_dict: dict[Hashable, Series] = {}
     idx = 0
@@ -1903,10 +1918,14 @@ def _managle_lambda_list(aggfuncs: Sequence[Any]) -> Sequence[Any]:
     if len(aggfuncs) <= 1:
         # don't mangle for .agg([lambda x: .])
         return aggfuncs
+    names = [com.get_callable_name(aggfunc) for aggfunc in aggfuncs]
+    if "<lambda>" not in names:
+        # nothing to mangle, avoid wrapping every aggfunc
+        return aggfuncs if isinstance(aggfuncs, list) else list(aggfuncs)
     i = 0
     mangled_aggfuncs = []
-    for aggfunc in aggfuncs:
-        if com.get_callable_name(aggfunc) == "<lambda>":
+    for aggfunc, name in zip(aggfuncs, names):
+        if name == "<lambda>":
             aggfunc = partial(aggfunc)
             aggfunc.__name__ = f"<lambda_{i}>"
             i += 1
@@ -1940,14 +1959,19 @@ def maybe_mangle_lambdas(agg_spec: Any) -> Any:
     [<function __main__.<lambda_0>,
      <function pandas...._make_lambda.<locals>.f(*args, **kwargs)>]
     """
-    is_dict = is_dict_like(agg_spec)
+    # cheap isinstance checks first for the common dict/list/str specs
+    is_dict = isinstance(agg_spec, dict) or is_dict_like(agg_spec)
     if not (is_dict or is_list_like(agg_spec)):
         return agg_spec
     mangled_aggspec = type(agg_spec)()  # dict or OrderedDict
 
     if is_dict:
         for key, aggfuncs in agg_spec.items():
-            if is_list_like(aggfuncs) and not is_dict_like(aggfuncs):
+            if isinstance(aggfuncs, list) or (
+                not isinstance(aggfuncs, str)
+                and is_list_like(aggfuncs)
+                and not is_dict_like(aggfuncs)
+            ):
                 mangled_aggfuncs = _managle_lambda_list(aggfuncs)
             else:
                 mangled_aggfuncs = aggfuncs
@@ -21,6 +21,7 @@ from pandas._libs.interval import (
     Interval,
     IntervalMixin,
     intervals_to_interval_bounds,
+    validate_interval_bounds,
 )
 from pandas._libs.missing import NA
 from pandas._typing import (
@@ -43,6 +44,7 @@ from pandas.util._decorators import Appender
 
 from pandas.core.dtypes.cast import (
     LossySetitemError,
+    construct_1d_object_array_from_listlike,
     maybe_upcast_numeric_to_64bit,
 )
 from pandas.core.dtypes.common import (
@@ -397,7 +399,8 @@ class IntervalArray(IntervalMixin, ExtensionArray):
 
     @classmethod
     def _from_factorized(cls, values: np.ndarray, original: IntervalArray) -> Self:
-        return cls._from_sequence(values, dtype=original.dtype)
+        # the uniques all come from a valid array of the same dtype
+        return cls(values, dtype=original.dtype, verify_integrity=False)
 
     _interval_shared_docs["from_breaks"] = textwrap.dedent(
         """
@@ -608,6 +611,24 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         dtype: Dtype | None = None,
     ) -> Self:
         if len(data):
+            if (
+                isinstance(data, list)
+                and isinstance(data[0], tuple)
+                and len(data[0]) == 2
+                # only numeric pairs can avoid an object round-trip
+                and all(lib.is_integer(x) or lib.is_float(x) for x in data[0])
+                and all(isinstance(d, tuple) and len(d) == 2 for d in data)
+            ):
+                values = np.asarray(data)
+                if values.ndim == 2 and values.dtype.kind in "if":
+                    # numeric pairs: split the columns instead of looping
+                    return cls.from_arrays(
+                        np.ascontiguousarray(values[:, 0]),
+                        np.ascontiguousarray(values[:, 1]),
+                        closed,
+                        copy=False,
+                        dtype=dtype,
+                    )
             left, right = [], []
         else:
             # ensure that empty data keeps input dtype
@@ -650,15 +671,40 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         if len(left) != len(right):
             msg = "left and right must have the same length"
             raise ValueError(msg)
-        left_mask = notna(left)
-        right_mask = notna(right)
-        if not (left_mask == right_mask).all():
+
+        left_values = getattr(left, "_ndarray", left)
+        right_values = getattr(right, "_ndarray", right)
+        if (
+            isinstance(left_values, np.ndarray)
+            and isinstance(right_values, np.ndarray)
+            and left_values.dtype == right_values.dtype
+            and left_values.dtype.kind in "fiumM"
+            and left_values.dtype.itemsize == 8
+            and left_values.dtype.isnative
+        ):
+            # single pass over the endpoints, no intermediate masks
+            datetimelike = left_values.dtype.kind in "mM"
+            if datetimelike:
+                left_values = left_values.view("i8")
+                right_values = right_values.view("i8")
+            invalid = validate_interval_bounds(left_values, right_values, datetimelike)
+        else:
+            left_mask = notna(left)
+            right_mask = notna(right)
+            if not (left_mask == right_mask).all():
+                invalid = 1
+            elif not (left[left_mask] <= right[left_mask]).all():
+                invalid = 2
+            else:
+                invalid = 0
+
+        if invalid == 1:
             msg = (
                 "missing values must be missing in the same "
                 "location both left and right sides"
             )
             raise ValueError(msg)
-        if not (left[left_mask] <= right[left_mask]).all():
+        if invalid == 2:
             msg = "left side of interval must be <= right side"
             raise ValueError(msg)
 
@@ -687,12 +733,12 @@ class IntervalArray(IntervalMixin, ExtensionArray):
 
     @property
     def nbytes(self) -> int:
-        return self.left.nbytes + self.right.nbytes
+        return self._left.nbytes + self._right.nbytes
 
     @property
     def size(self) -> int:
         # Avoid materializing self.values
-        return self.left.size
+        return self._left.size
 
     # ---------------------------------------------------------------------
     # EA Interface
@@ -710,7 +756,9 @@ class IntervalArray(IntervalMixin, ExtensionArray):
     def __getitem__(self, key: SequenceIndexer) -> Self: ...
 
     def __getitem__(self, key: PositionalIndexer) -> Self | IntervalOrNA:
-        key = check_array_indexer(self, key)
+        # integers and slices need no conversion
+        if not (lib.is_integer(key) or isinstance(key, slice)):
+            key = check_array_indexer(self, key)
         left = self._left[key]
         right = self._right[key]
 
@@ -799,6 +847,20 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         if not is_object_dtype(other_dtype):
             return invalid_comparison(self, other, op)
 
+        if (
+            op in (operator.eq, operator.ne)
+            and isinstance(self._left, np.ndarray)
+            and all(isinstance(obj, Interval) for obj in other)
+        ):
+            # only Interval objects (e.g. mixed closed): compare the endpoints
+            # as arrays instead of boxing each element of self
+            result = (
+                np.array([obj.closed == self.closed for obj in other], dtype=bool)
+                & (self._left == np.array([obj.left for obj in other]))
+                & (self._right == np.array([obj.right for obj in other]))
+            )
+            return result if op is operator.eq else ~result
+
         # object dtype -> iteratively check for intervals
         result = np.zeros(len(self), dtype=bool)
         for i, obj in enumerate(other):
@@ -1016,8 +1078,11 @@ class IntervalArray(IntervalMixin, ExtensionArray):
             raise ValueError("Intervals must all be closed on the same side.")
         closed = closed_set.pop()
 
-        left: IntervalSide = np.concatenate([interval.left for interval in to_concat])
-        right: IntervalSide = np.concatenate([interval.right for interval in to_concat])
+        # the stored endpoint arrays, not .left/.right, which wrap each in an Index
+        left: IntervalSide = np.concatenate([interval._left for interval in to_concat])
+        right: IntervalSide = np.concatenate(
+            [interval._right for interval in to_concat]
+        )
 
         left, right, dtype = cls._ensure_simple_new_inputs(left, right, closed=closed)
 
@@ -1037,7 +1102,14 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         return self._simple_new(left, right, dtype=dtype)
 
     def isna(self) -> np.ndarray:
-        return isna(self._left)
+        left = self._left
+        if isinstance(left, np.ndarray):
+            # skip the generic isna dispatch for the numeric subtypes
+            if left.dtype.kind == "f":
+                return np.isnan(left)
+            elif left.dtype.kind in "iu":
+                return np.zeros(len(left), dtype=bool)
+        return isna(left)
 
     def shift(self, periods: int = 1, fill_value: object = None) -> IntervalArray:
         if not len(self) or periods == 0:
@@ -1175,9 +1247,18 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         return left, right
 
     def _validate_setitem_value(self, value):
-        if is_valid_na_for_dtype(value, self.left.dtype):
+        # build the Index wrapper once rather than on every self.left access
+        left = self.left
+        if isinstance(value, Interval):
+            # scalar interval; checked first as the most common case
+            self._check_closed_matches(value, name="value")
+            value_left, value_right = value.left, value.right
+            left._validate_fill_value(value_left)
+            left._validate_fill_value(value_right)
+
+        elif is_valid_na_for_dtype(value, left.dtype):
             # na value: need special casing to set directly on numpy arrays
-            value = self.left._na_value
+            value = left._na_value
             if is_integer_dtype(self.dtype.subtype):
                 # can't set NaN on a numpy integer array
                 # GH#45484 TypeError, not ValueError, matches what we get with
@@ -1185,13 +1266,6 @@ class IntervalArray(IntervalMixin, ExtensionArray):
                 raise TypeError("Cannot set float NaN to integer-backed IntervalArray")
             value_left, value_right = value, value
 
-        elif isinstance(value, Interval):
-            # scalar interval
-            self._check_closed_matches(value, name="value")
-            value_left, value_right = value.left, value.right
-            self.left._validate_fill_value(value_left)
-            self.left._validate_fill_value(value_right)
-
         else:
             return self._validate_listlike(value)
 
@@ -1664,11 +1738,15 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         closed = self.closed
 
         result = np.empty(len(left), dtype=object)
-        for i, left_value in enumerate(left):
-            if mask[i]:
+        # iterate all three together: positional lookups on DatetimeArray/
+        # TimedeltaArray endpoints box one element at a time
+        for i, (left_value, right_value, is_na) in enumerate(
+            zip(left, right, mask.tolist())
+        ):
+            if is_na:
                 result[i] = np.nan
             else:
-                result[i] = Interval(left_value, right[i], closed)
+                result[i] = Interval(left_value, right_value, closed)
         return result
 
     def __arrow_array__(self, type=None):
@@ -1785,7 +1863,14 @@ class IntervalArray(IntervalMixin, ExtensionArray):
         >>> idx.to_tuples()
         Index([(0, 1), (1, 2)], dtype='object')
         """
-        tuples = com.asarray_tuplesafe(zip(self._left, self._right))
+        if len(self):
+            # build the object array directly; asarray_tuplesafe would first
+            #  coerce the pairs to a 2D array and then re-tuple every row
+            tuples = construct_1d_object_array_from_listlike(
+                list(zip(self._left, self._right))
+            )
+        else:
+            tuples = com.asarray_tuplesafe(zip(self._left, self._right))
         if not na_tuple:
             # GH 18756
             tuples = np.where(~self.isna(), tuples, np.nan)
@@ -1942,7 +2027,7 @@ class IntervalArray(IntervalMixin, ExtensionArray):
                 # Union[bool, int, float, complex, str, bytes]]]"
                 return np.isin(left, right).ravel()  # type: ignore[arg-type]
 
-            elif needs_i8_conversion(self.left.dtype) ^ needs_i8_conversion(
+            elif needs_i8_conversion(self._left.dtype) ^ needs_i8_conversion(
                 values.left.dtype
             ):
                 # not comparable -> no overlap
@@ -1952,16 +2037,16 @@ class IntervalArray(IntervalMixin, ExtensionArray):
 
     @property
     def _combined(self) -> IntervalSide:
-        # error: Item "ExtensionArray" of "ExtensionArray | ndarray[Any, Any]"
-        # has no attribute "reshape"  [union-attr]
-        left = self.left._values.reshape(-1, 1)  # type: ignore[union-attr]
-        right = self.right._values.reshape(-1, 1)  # type: ignore[union-attr]
-        if needs_i8_conversion(left.dtype):
-            # error: Item "ndarray[Any, Any]" of "Any | ndarray[Any, Any]" has
-            # no attribute "_concat_same_type"
-            comb = left._concat_same_type(  # type: ignore[union-attr]
-                [left, right], axis=1
-            )
+        left = self._left.reshape(-1, 1)
+        right = self._right.reshape(-1, 1)
+        # left and right share a dtype, so they are the same array type
+        comb: IntervalSide
+        if isinstance(left, DatetimeArray):
+            assert isinstance(right, DatetimeArray)
+            comb = left._concat_same_type([left, right], axis=1)
+        elif isinstance(left, TimedeltaArray):
+            assert isinstance(right, TimedeltaArray)
+            comb = left._concat_same_type([left, right], axis=1)
         else:
             comb = np.concatenate([left, right], axis=1)
         return comb
@@ -2014,7 +2099,10 @@ def _maybe_convert_platform_interval(values) -> ArrayLike:
     -------
     array
     """
-    if isinstance(values, (list, tuple)) and len(values) == 0:
+    if isinstance(values, np.ndarray):
+        # nothing to convert; the checks below all pass ndarrays through
+        return values
+    elif isinstance(values, (list, tuple)) and len(values) == 0:
         # GH 19016
         # empty lists/tuples get object dtype by default, but this is
         # prohibited for IntervalArray, so coerce to integer instead
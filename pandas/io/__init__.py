@@ -1,6 +1,8 @@
 # ruff: noqa: TC004
 from typing import TYPE_CHECKING
 
+from pandas._lazy import install
+
 if TYPE_CHECKING:
     # import modules that have public classes/functions
     from pandas.io import (
@@ -11,3 +13,31 @@ if TYPE_CHECKING:
 
     # mark only those modules as public
     __all__ = ["formats", "json", "stata"]
+
+# submodules are imported on first access, e.g. ``pd.io.sql`` after a bare
+#  ``import pandas`` loads only pandas.io.sql
+install(
+    {
+        "api": "pandas.io.api",
+        "clipboard": "pandas.io.clipboard",
+        "clipboards": "pandas.io.clipboards",
+        "common": "pandas.io.common",
+        "excel": "pandas.io.excel",
+        "feather_format": "pandas.io.feather_format",
+        "formats": "pandas.io.formats",
+        "html": "pandas.io.html",
+        "json": "pandas.io.json",
+        "orc": "pandas.io.orc",
+        "parquet": "pandas.io.parquet",
+        "parsers": "pandas.io.parsers",
+        "pickle": "pandas.io.pickle",
+        "pytables": "pandas.io.pytables",
+        "sas": "pandas.io.sas",
+        "spss": "pandas.io.spss",
+        "sql": "pandas.io.sql",
+        "stata": "pandas.io.stata",
+        "xml": "pandas.io.xml",
+    },
+    globals(),
+)
+del install
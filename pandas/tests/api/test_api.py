@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 
+from pandas.compat import WASM
+
 import pandas as pd
 from pandas import api
 import pandas._testing as tm
@@ -47,7 +52,14 @@ class TestPDApi(Base):
         "io",
         "tseries",
     ]
-    private_lib = ["compat", "core", "pandas", "util", "_built_with_meson"]
+    private_lib = [
+        "compat",
+        "core",
+        "pandas",
+        "util",
+        "_built_with_meson",
+        "_lazy_imports",
+    ]
 
     # misc
     misc = ["IndexSlice", "NaT", "NA"]
@@ -186,6 +198,7 @@ class TestPDApi(Base):
         "_config",
         "_libs",
         "_is_numpy_dev",
+        "_lazy",
         "_pandas_datetime_CAPI",
         "_pandas_parser_CAPI",
         "_testing",
@@ -240,6 +253,61 @@ class TestPDApi(Base):
             with tm.assert_produces_warning(FutureWarning):
                 _ = getattr(pd, depr)
 
+    def test_lazy_imports(self):
+        # names deferred to first access are still listed and resolvable
+        for name in pd._lazy_imports:
+            assert name in dir(pd)
+            assert getattr(pd, name) is not None
+
+        msg = "module 'pandas' has no attribute 'not_a_pandas_name'"
+        with pytest.raises(AttributeError, match=msg):
+            pd.not_a_pandas_name
+
+    @pytest.mark.skipif(WASM, reason="Can't start subprocesses in WASM")
+    @pytest.mark.single_cpu
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "matplotlib",
+            "pandas._testing",
+            "pandas.io.pytables",
+            "pandas.core.computation.expr",
+            "pandas.core.reshape.merge",
+        ],
+    )
+    def test_import_defers_module(self, module):
+        # plotting backends, testing helpers, io backends, the eval
+        # machinery and the merge/pivot/tile functions are only imported
+        # when used
+        code = f"import sys; import pandas; assert {module!r} not in sys.modules"
+        subprocess.check_output([sys.executable, "-c", code])
+
+    @pytest.mark.skipif(WASM, reason="Can't start subprocesses in WASM")
+    @pytest.mark.single_cpu
+    def test_io_public_submodules_resolve(self):
+        submodules = [
+            "api",
+            "clipboards",
+            "common",
+            "excel",
+            "feather_format",
+            "formats",
+            "html",
+            "json",
+            "orc",
+            "parquet",
+            "parsers",
+            "pickle",
+            "pytables",
+            "sas",
+            "spss",
+            "sql",
+            "stata",
+            "xml",
+        ]
+        code = "import pandas; " + "; ".join(f"pandas.io.{name}" for name in submodules)
+        subprocess.check_output([sys.executable, "-c", code])
+
 
 class TestApi(Base):
     allowed_api_dirs = [
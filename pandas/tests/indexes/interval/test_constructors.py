@@ -277,6 +277,54 @@ class TestFromArrays(ConstructorTests):
         expected3 = interval_cls.from_arrays(left3.as_unit("ms"), right3)
         tm.assert_equal(result3, expected3)
 
+    @pytest.mark.parametrize(
+        "breaks",
+        [
+            np.arange(4, dtype="int64"),
+            np.arange(4, dtype="uint64"),
+            np.arange(4, dtype="float64"),
+            date_range("2016-01-01", periods=4).array,
+            timedelta_range("1 day", periods=4).array,
+        ],
+    )
+    def test_from_arrays_invalid_endpoints(self, breaks):
+        left, right = breaks[:3].copy(), breaks[1:].copy()
+        left[1], right[1] = right[1], left[1]
+        msg = "left side of interval must be <= right side"
+        with pytest.raises(ValueError, match=msg):
+            IntervalArray.from_arrays(left, right)
+
+    @pytest.mark.parametrize(
+        "breaks",
+        [
+            np.arange(4, dtype="float64"),
+            date_range("2016-01-01", periods=4).array,
+            timedelta_range("1 day", periods=4).array,
+        ],
+    )
+    def test_from_arrays_mismatched_missing_endpoints(self, breaks):
+        # mismatched missing values are reported before misordered endpoints
+        left, right = breaks[:3].copy(), breaks[1:].copy()
+        left[1], right[1] = right[1], left[1]
+        right[2] = None
+        msg = "missing values must be missing in the same location"
+        with pytest.raises(ValueError, match=msg):
+            IntervalArray.from_arrays(left, right)
+
+    @pytest.mark.parametrize("dtype", ["int64", "float64"])
+    def test_from_arrays_non_native_byteorder(self, dtype):
+        # non-native endpoints are validated without the compiled fast path
+        dtype = np.dtype(dtype).newbyteorder()
+        left = np.array([0, 1], dtype=dtype)
+        right = np.array([1, 2], dtype=dtype)
+        result = IntervalArray.from_arrays(left, right)
+        assert list(result.left) == [0, 1]
+        assert list(result.right) == [1, 2]
+
+        msg = "left side of interval must be <= right side"
+        with pytest.raises(ValueError, match=msg):
+            IntervalArray.from_arrays(right, left)
+
 
 class TestFromBreaks(ConstructorTests):
     """Tests specific to IntervalIndex.from_breaks"""
@@ -367,6 +415,19 @@ class TestFromTuples(ConstructorTests):
         idx_na_element = IntervalIndex.from_tuples([(0, 1), np.nan, (2, 3)])
         tm.assert_index_equal(idx_na_tuple, idx_na_element)
 
+    @pytest.mark.parametrize(
+        "tuples, left, right",
+        [
+            ([(0, 1), (1, 2)], [0, 1], [1, 2]),
+            ([(0, 1.5), (1, 2)], [0.0, 1.0], [1.5, 2.0]),
+            ([(0, 1), (np.nan, np.nan)], [0, np.nan], [1, np.nan]),
+        ],
+    )
+    def test_numeric_tuples(self, tuples, left, right):
+        result = IntervalIndex.from_tuples(tuples)
+        expected = IntervalIndex.from_arrays(left, right)
+        tm.assert_index_equal(result, expected)
+
 
 class TestClassConstructors(ConstructorTests):
     """Tests specific to the IntervalIndex/Index constructors"""
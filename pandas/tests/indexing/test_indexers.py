@@ -16,6 +16,26 @@ def test_length_of_indexer():
     assert result == 1
 
 
+@pytest.mark.parametrize(
+    "indexer",
+    [
+        slice(None),
+        slice(1, 3),
+        slice(None, None, 2),
+        slice(-3, None),
+        slice(-10, 10),
+        slice(3, 1),
+        slice(None, None, -1),
+        slice(4, 0, -2),
+        slice(None, -10, -1),
+    ],
+)
+def test_length_of_indexer_slice(indexer):
+    target = np.arange(5)
+    result = length_of_indexer(indexer, target)
+    assert result == len(target[indexer])
+
+
 def test_is_scalar_indexer():
     indexer = (0, 1)
     assert is_scalar_indexer(indexer, 2)
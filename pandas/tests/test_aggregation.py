@@ -23,6 +23,15 @@ def test_maybe_mangle_lambdas_listlike():
     assert aggfuncs[1](None) == result[1](None)
 
 
+def test_maybe_mangle_lambdas_no_lambdas():
+    aggfuncs = ["sum", np.mean]
+    result = maybe_mangle_lambdas(aggfuncs)
+    assert result is aggfuncs
+
+    result = maybe_mangle_lambdas(("sum", np.mean))
+    assert result == ["sum", np.mean]
+
+
 def test_maybe_mangle_lambdas():
     func = {"A": [lambda x: 0, lambda x: 1]}
     result = maybe_mangle_lambdas(func)
@@ -1,8 +1,11 @@
 import os
 
+import numpy as np
 import pytest
 
 from pandas import (
+    Index,
+    Series,
     array,
     compat,
 )
@@ -56,3 +59,24 @@ def test_is_sorted():
     arr = array([4, 2, 3], dtype="Int64")
     with pytest.raises(AssertionError, match="ExtensionArray are different"):
         tm.assert_is_sorted(arr)
+
+
+@pytest.mark.parametrize("box", [Index, Series])
+def test_is_sorted_index_series(box):
+    tm.assert_is_sorted(box([1, 2, 2, 3]))
+
+    with pytest.raises(AssertionError, match="numpy array are different"):
+        tm.assert_is_sorted(box([4, 2, 3]))
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint8", "float64", "bool"])
+def test_is_sorted_ndarray(dtype):
+    tm.assert_is_sorted(np.array([0, 1, 1], dtype=dtype))
+
+    with pytest.raises(AssertionError, match="numpy array are different"):
+        tm.assert_is_sorted(np.array([1, 0, 1], dtype=dtype))
+
+
+def test_is_sorted_ndarray_nan_last():
+    # NaN sorts to the end, so the sort-based fallback accepts it
+    tm.assert_is_sorted(np.array([1.0, 2.0, np.nan]))